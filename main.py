@@ -1,14 +1,20 @@
 # app/main.py
 
-from typing import Optional
+import asyncio
+import hashlib
+import os
+from collections import OrderedDict
+from datetime import date
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional
 from pathlib import Path
 
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
 
-from app.utils.file_extractor import extract_text_from_bytes
+from app.utils.file_extractor import FileBytes, extract_text_from_bytes
 from app.utils.text_analyzer import analyze_resume_text
 
 # from utils.file_extractor import extract_text_from_bytes
@@ -17,6 +23,87 @@ from app.utils.text_analyzer import analyze_resume_text
 BASE_DIR = Path(__file__).resolve().parent
 STATIC_DIR = BASE_DIR / "static"
 
+# LRU cache of analysis results, keyed by a content hash of the upload plus
+# the parameters that affect the result. Repeat uploads skip the pipeline.
+# Open-ended ranges ("Jan 2015 - Present") are measured up to today's month,
+# so the current year and month are part of the key as well.
+RESULT_CACHE_SIZE = 256
+_RESULT_CACHE: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+
+
+def _result_cache_key(
+    file_bytes: FileBytes, filename: str, target_department: Optional[str]
+) -> bytes:
+    # blake2b is fast and sufficient for a non-cryptographic content key.
+    # Only the extension of the filename influences how the bytes are parsed.
+    digest = hashlib.blake2b(file_bytes, digest_size=16).digest()
+    ext = filename.rsplit(".", 1)[-1].lower()
+    month = date.today().strftime("%Y%m")
+    return b"\0".join(
+        [digest, ext.encode(), (target_department or "").encode(), month.encode()]
+    )
+
+
+# Uploads are read in chunks into a single buffer capped at this size.
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+async def _read_upload(file: UploadFile) -> bytearray:
+    if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail="File too large.")
+
+    buf = bytearray()
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        buf.extend(chunk)
+        if len(buf) > MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=413, detail="File too large.")
+    return buf
+
+
+class AnalysisError(Exception):
+    """
+    Raised by _do_analysis with the HTTP status and detail to report.
+    Kept picklable so it can cross the worker process boundary.
+    """
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(status_code, detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def _do_analysis(
+    file_bytes: FileBytes, filename: str, target_department: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Extract and analyze an uploaded resume. Runs in a worker process, so it
+    must stay a module-level function.
+    """
+    try:
+        text = extract_text_from_bytes(file_bytes, filename)
+    except ValueError as ve:
+        raise AnalysisError(400, str(ve))
+    except Exception:
+        raise AnalysisError(500, "Error while extracting text.")
+
+    if not text.strip():
+        raise AnalysisError(
+            400,
+            "Could not extract any text from the file. "
+            "It might be a scanned/image PDF.",
+        )
+
+    result = analyze_resume_text(text, target_department)
+    result["text_preview"] = text[:8000]  # include extracted text
+    return result
+
+
+# The analysis is CPU-bound pure Python; running it in worker processes keeps
+# the event loop free and lets concurrent uploads use all cores. Until startup
+# creates the pool, run_in_executor(None, ...) falls back to the thread pool.
+_POOL: Optional[ProcessPoolExecutor] = None
+
 app = FastAPI(
     title="Resume Analyzer",
     description="Analyze resumes for degrees, PhD, department, experience, and publications.",
@@ -31,24 +118,48 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.on_event("startup")
+def start_worker_pool():
+    global _POOL
+    _POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+
+def _replace_broken_pool(broken: Optional[ProcessPoolExecutor]) -> None:
+    """
+    A worker that dies (e.g. a parser crash or the OOM killer) leaves the
+    executor unusable, so swap in a fresh one. Concurrent requests that hit
+    the same broken pool only replace it once.
+    """
+    global _POOL
+    if broken is None or _POOL is not broken:
+        return
+    broken.shutdown(wait=False)
+    _POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+
+@app.on_event("shutdown")
+def stop_worker_pool():
+    global _POOL
+    if _POOL is not None:
+        _POOL.shutdown(wait=False)
+        _POOL = None
+
+
 app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
+# /ui serves static/index.html directly (GET /ui redirects to /ui/).
+app.mount("/ui", StaticFiles(directory=str(STATIC_DIR), html=True), name="ui")
+
+ROOT_INFO: Dict[str, str] = {
+    "message": "Resume Analyzer API is running.",
+    "ui": "Open /ui in your browser to use the web interface.",
+    "docs": "/docs",
+}
 
 
 @app.get("/")
 def read_root():
-    return {
-        "message": "Resume Analyzer API is running.",
-        "ui": "Open /ui in your browser to use the web interface.",
-        "docs": "/docs",
-    }
-
-
-@app.get("/ui")
-async def serve_ui():
-    index_path = STATIC_DIR / "index.html"
-    if not index_path.exists():
-        raise HTTPException(status_code=500, detail="UI file not found.")
-    return FileResponse(index_path)
+    return ROOT_INFO
 
 
 @app.post("/analyze-resume")
@@ -59,24 +170,35 @@ async def analyze_resume(
     if not file.filename:
         raise HTTPException(status_code=400, detail="No file uploaded.")
 
-    file_bytes = await file.read()
+    try:
+        file_bytes = await _read_upload(file)
+    finally:
+        await file.close()
     if not file_bytes:
         raise HTTPException(status_code=400, detail="Uploaded file is empty.")
 
-    try:
-        text = extract_text_from_bytes(file_bytes, file.filename)
-    except ValueError as ve:
-        raise HTTPException(status_code=400, detail=str(ve))
-    except Exception:
-        raise HTTPException(status_code=500, detail="Error while extracting text.")
+    cache_key = _result_cache_key(file_bytes, file.filename, target_department)
+    cached = _RESULT_CACHE.get(cache_key)
+    if cached is not None:
+        _RESULT_CACHE.move_to_end(cache_key)
+        return cached
 
-    if not text.strip():
+    loop = asyncio.get_running_loop()
+    pool = _POOL
+    try:
+        result = await loop.run_in_executor(
+            pool, _do_analysis, file_bytes, file.filename, target_department
+        )
+    except AnalysisError as ae:
+        raise HTTPException(status_code=ae.status_code, detail=ae.detail)
+    except BrokenProcessPool:
+        _replace_broken_pool(pool)
         raise HTTPException(
-            status_code=400,
-            detail="Could not extract any text from the file. "
-                   "It might be a scanned/image PDF.",
+            status_code=500,
+            detail="The analysis worker stopped unexpectedly. Please try again.",
         )
 
-    result = analyze_resume_text(text, target_department)
-    result["text_preview"] = text[:8000]  # include extracted text
+    _RESULT_CACHE[cache_key] = result
+    if len(_RESULT_CACHE) > RESULT_CACHE_SIZE:
+        _RESULT_CACHE.popitem(last=False)
     return result
\ No newline at end of file
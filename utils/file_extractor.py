@@ -1,14 +1,17 @@
 # app/utils/file_extractor.py
 
 from io import BytesIO
-from typing import Optional
+from typing import Optional, Union
 
 import fitz  # PyMuPDF
 import pdfplumber
 from docx import Document
 
+# Upload buffers are passed through without copying them into bytes.
+FileBytes = Union[bytes, bytearray]
 
-def extract_text_from_bytes(file_bytes: bytes, filename: Optional[str]) -> str:
+
+def extract_text_from_bytes(file_bytes: FileBytes, filename: Optional[str]) -> str:
     """
     Extract text from PDF, DOCX, or TXT file bytes.
     """
@@ -30,7 +33,7 @@ def extract_text_from_bytes(file_bytes: bytes, filename: Optional[str]) -> str:
         raise ValueError("Unsupported file type. Use PDF, DOCX, or TXT.")
 
 
-def _extract_text_from_pdf(file_bytes: bytes) -> str:
+def _extract_text_from_pdf(file_bytes: FileBytes) -> str:
     """
     Extract text from a PDF using PyMuPDF first, then pdfplumber as a fallback.
     """
@@ -59,13 +62,13 @@ def _extract_text_from_pdf(file_bytes: bytes) -> str:
     return text.strip()
 
 
-def _extract_text_from_docx(file_bytes: bytes) -> str:
+def _extract_text_from_docx(file_bytes: FileBytes) -> str:
     document = Document(BytesIO(file_bytes))
     paragraphs = [p.text for p in document.paragraphs if p.text]
     return "\n".join(paragraphs).strip()
 
 
-def _extract_text_from_txt(file_bytes: bytes) -> str:
+def _extract_text_from_txt(file_bytes: FileBytes) -> str:
     try:
         return file_bytes.decode("utf-8").strip()
     except UnicodeDecodeError:
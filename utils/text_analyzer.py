@@ -1,8 +1,31 @@
 # app/utils/text_analyzer.py
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Mapping, Optional, Tuple
 import re
 from datetime import date
+from types import MappingProxyType
+
+import ahocorasick
+
+try:
+    import re2
+except ImportError:  # RE2 wheels are not available on every platform
+    re2 = None
+
+
+def _compile_linear(pattern: str) -> Any:
+    r"""
+    Compile a pattern that scans whole documents and is prone to
+    backtracking blowups. Uses RE2 (linear time) when installed, else re.
+
+    RE2's \s, \b, \d and case folding are ASCII-only, unlike re's, so
+    only case-sensitive patterns built from explicit ASCII classes may use
+    this; everything else stays on re so results match with or without RE2.
+    """
+    if re2 is not None:
+        return re2.compile(pattern)
+    return re.compile(pattern)
+
 
 # ---------- Degree detection patterns ----------
 
@@ -47,32 +70,52 @@ DEGREE_PATTERNS: Dict[str, str] = {
     r"\bhsc\b": "HighSchool",
 }
 
-DEGREE_PRIORITY: Dict[str, int] = {
+
+def _build_degree_regex() -> Tuple[re.Pattern, Dict[str, str]]:
+    """
+    Collapse DEGREE_PATTERNS into a single alternation with one named group
+    per degree label, so a block is scanned once instead of once per pattern.
+    Group names are generated (g0, g1, ...) and mapped back to the label.
+    """
+    grouped: Dict[str, List[str]] = {}
+    for pattern, degree_name in DEGREE_PATTERNS.items():
+        grouped.setdefault(degree_name, []).append(pattern)
+
+    group_labels: Dict[str, str] = {}
+    parts: List[str] = []
+    for i, (degree_name, patterns) in enumerate(grouped.items()):
+        group = f"g{i}"
+        group_labels[group] = degree_name
+        parts.append(f"(?P<{group}>{'|'.join(patterns)})")
+    return re.compile("|".join(parts), re.IGNORECASE), group_labels
+
+
+_DEGREE_RX, _DEGREE_GROUP_LABELS = _build_degree_regex()
+
+DEGREE_PRIORITY: Mapping[str, int] = MappingProxyType({
     "HighSchool": 1,
     "Diploma": 2,
     "Bachelor": 3,
     "Master": 4,
     "PhD": 5,
-}
+})
+
+
+def _degree_priority(degree: str) -> int:
+    return DEGREE_PRIORITY.get(degree, 0)
 
 # ---------- Department keywords ----------
 
+# Order is precedence: when several keywords occur, the department of the
+# earliest entry wins. Scanning is a single automaton pass, so the order has
+# no effect on speed. Entries that contain a keyword of the same department
+# listed next to them (e.g. "english literature" vs "english") can never
+# change the result and are omitted.
 DEPARTMENT_KEYWORDS: Dict[str, str] = {
     # English / Humanities
-    "english language and literature": "English",
-    "department of english language and literature": "English",
-    "english literature": "English",
-    "department of english": "English",
-    "m.a (english)": "English",
-    "ma (english)": "English",
-    "b.a (english)": "English",
-    "b.a (english literature)": "English",
-    "ba (english)": "English",
-    "english": "English",   # generic
+    "english": "English",
 
     # Computer Science / IT
-    "computer science and engineering": "Computer Science",
-    "computer science & engineering": "Computer Science",
     "computer science": "Computer Science",
     "information technology": "Computer Science",
     "information systems": "Computer Science",
@@ -109,9 +152,7 @@ DEPARTMENT_KEYWORDS: Dict[str, str] = {
     "structural engineering": "Civil",
 
     # Sciences
-    "applied physics": "Physics",
     "physics": "Physics",
-    "applied mathematics": "Mathematics",
     "mathematics": "Mathematics",
     "chemistry": "Chemistry",
     "biotechnology": "Biotechnology",
@@ -126,28 +167,87 @@ EDU_SECTION_TITLES: List[str] = [
     "qualifications",
 ]
 
-# ---------- Helpers: education section ----------
 
-def extract_education_section(text: str) -> str:
+def _build_keyword_automaton(keywords: List[str], values: List[Any]) -> ahocorasick.Automaton:
     """
-    Find the 'Education' heading and return text from there until the end.
-    If not found, return the whole text.
+    Build an Aho-Corasick automaton over lowercase keywords. Each keyword maps
+    to (priority_index, value) so callers can recover list/dict order from
+    the matches of a single scan.
     """
-    lines = text.splitlines()
-    if not lines:
-        return text
+    automaton = ahocorasick.Automaton()
+    for idx, (keyword, value) in enumerate(zip(keywords, values)):
+        if keyword not in automaton:
+            automaton.add_word(keyword, (idx, value))
+    automaton.make_automaton()
+    return automaton
 
-    start_idx: Optional[int] = None
-    for i, line in enumerate(lines):
-        ll = line.strip().lower()
-        if any(title in ll for title in EDU_SECTION_TITLES):
-            start_idx = i
+
+_DEPT_AC = _build_keyword_automaton(
+    list(DEPARTMENT_KEYWORDS.keys()), list(DEPARTMENT_KEYWORDS.values())
+)
+_EDU_AC = _build_keyword_automaton(EDU_SECTION_TITLES, EDU_SECTION_TITLES)
+
+# ---------- Helpers: education section ----------
+
+# Line boundaries as recognised by str.splitlines().
+_LINE_BREAK_CHARS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+_LINE_BREAK_RX = re.compile(r"\r\n|[\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+
+
+def _education_start(text: str, text_low: str) -> Optional[int]:
+    """
+    Character offset in text of the first line containing an education
+    section title, or None if there is no such line.
+    """
+    # Matches are emitted by end position, so the first one lies on the
+    # earliest line containing any title.
+    first_end: Optional[int] = None
+    for end_idx, _ in _EDU_AC.iter(text_low):
+        first_end = end_idx
+        break
+
+    if first_end is None:
+        return None
+
+    if len(text_low) == len(text):
+        return max(text_low.rfind(c, 0, first_end) for c in _LINE_BREAK_CHARS) + 1
+
+    # lower() changed the length, so offsets differ between the two strings;
+    # walk to the heading line by line-break count, which lower() preserves.
+    breaks = sum(1 for _ in _LINE_BREAK_RX.finditer(text_low, 0, first_end))
+    start = 0
+    for m in _LINE_BREAK_RX.finditer(text):
+        if breaks == 0:
             break
+        start = m.end()
+        breaks -= 1
+    return start
+
+
+def find_education_section(text: str, text_low: Optional[str] = None) -> Tuple[int, int]:
+    """
+    Return (start, end) character offsets of the education section in text,
+    from the 'Education' heading line until the end. If not found, the
+    bounds cover the whole text.
+    """
+    if text_low is None:
+        text_low = text.lower()
+    start = _education_start(text, text_low)
+    return (start or 0), len(text)
+
 
-    if start_idx is None:
+def extract_education_section(text: str, text_low: Optional[str] = None) -> str:
+    """
+    Find the 'Education' heading and return text from there until the end.
+    If not found, return the whole text.
+    """
+    if text_low is None:
+        text_low = text.lower()
+    start = _education_start(text, text_low)
+    if start is None:
         return text
 
-    section = "\n".join(lines[start_idx:]).strip()
+    section = "\n".join(text[start:].splitlines()).strip()
     return section or text
 
 # ---------- Degree detail extraction ----------
@@ -156,61 +256,70 @@ def detect_degrees_simple(text: str) -> List[str]:
     """
     Simple detection of degree *types* used as fallback.
     """
-    text_low = text.lower()
-    found: List[str] = []
-    for pattern, degree_name in DEGREE_PATTERNS.items():
-        if re.search(pattern, text_low):
-            if degree_name not in found:
-                found.append(degree_name)
-    return found
+    labels = {_DEGREE_GROUP_LABELS[m.lastgroup] for m in _DEGREE_RX.finditer(text)}
+    return sorted(labels, key=_degree_priority, reverse=True)
 
 
 def determine_highest_degree(degrees: List[str]) -> str:
-    if not degrees:
+    best_degree = max(degrees, key=_degree_priority, default=None)
+    if best_degree is None or _degree_priority(best_degree) == 0:
         return "Unknown"
-    best_degree = "Unknown"
-    best_priority = 0
-    for d in degrees:
-        priority = DEGREE_PRIORITY.get(d, 0)
-        if priority > best_priority:
-            best_priority = priority
-            best_degree = d
     return best_degree
 
 
-def get_phd_status(text: str) -> Optional[str]:
+_PHD_RX = re.compile(r"ph\.?\s*d\.?|phd")
+
+# Matched at the start of a lowercase window around a PhD mention. The
+# lookahead alternatives are tried in priority order, so 'awarded' wins over
+# 'thesis submitted', which wins over the pursuing keywords.
+_PHD_STATUS_RX = re.compile(
+    r"(?=.*awarded)(?P<awarded>)"
+    r"|(?=.*(?:thesis submitted|submitted thesis))(?P<submitted>)"
+    r"|(?=.*(?:pursuing|ongoing|currently|in progress))(?P<pursuing>)",
+    re.DOTALL,
+)
+_PHD_STATUS_LABELS: Dict[str, str] = {
+    "awarded": "Awarded",
+    "submitted": "Thesis Submitted",
+    "pursuing": "Pursuing",
+}
+
+
+def get_phd_status(text: str, text_low: Optional[str] = None) -> Optional[str]:
     """
     Try to infer PhD status from surrounding text; returns one of:
     'Awarded', 'Thesis Submitted', 'Pursuing', or None.
     """
-    low = text.lower()
-    statuses: List[str] = []
+    low = text_low if text_low is not None else text.lower()
+    status: Optional[str] = None
 
-    for m in re.finditer(r"ph\.?\s*d\.?|phd", low):
-        window = low[max(0, m.start() - 100): m.end() + 100]
-        if "awarded" in window:
+    for m in _PHD_RX.finditer(low):
+        sm = _PHD_STATUS_RX.match(low, max(0, m.start() - 100), m.end() + 100)
+        if sm is None:
+            continue
+        if sm.lastgroup == "awarded":
             return "Awarded"
-        if "thesis submitted" in window or "submitted thesis" in window:
-            statuses.append("Thesis Submitted")
-        if any(w in window for w in ["pursuing", "ongoing", "currently", "in progress"]):
-            statuses.append("Pursuing")
+        if status is None:
+            status = _PHD_STATUS_LABELS[sm.lastgroup]
+
+    return status
 
-    return statuses[0] if statuses else None
+
+_YEAR_RANGE_RX = re.compile(
+    r"((?:19|20)\d{2})\s*[-–]\s*(\d{4}|Present|Ongoing|Pursuing|Till Date|Current)",
+    re.IGNORECASE,
+)
+_YEAR_RX = re.compile(r"\b(?:19|20)\d{2}\b")
 
 
 def extract_years_from_text(text: str) -> Tuple[Optional[int], Optional[int]]:
     """
     Extract start and end/passing year from a piece of text.
     """
-    range_pattern = re.compile(
-        r"(19|20)\d{2}\s*[-–]\s*(\d{4}|Present|present|Ongoing|ongoing|Pursuing|pursuing|Till Date|till date|Current|current)"
-    )
-    single_year_pattern = re.compile(r"\b(19|20)\d{2}\b")
-
-    m = range_pattern.search(text)
+    m = _YEAR_RANGE_RX.search(text)
     if m:
-        start_year = int(m.group(0)[0:4])
-        end_part = m.group(0).split("-")[-1].strip()
+        start_year = int(m.group(1))
+        end_part = m.group(2)
         if end_part.isdigit():
             end_year = int(end_part)
         else:
@@ -218,16 +327,21 @@ def extract_years_from_text(text: str) -> Tuple[Optional[int], Optional[int]]:
         return start_year, end_year
 
     # Fallback: any single year (treat as end/passing year)
-    m2 = single_year_pattern.findall(text)
-    if m2:
+    years = _YEAR_RX.findall(text)
+    if years:
         # take the last year in the text
-        years = re.findall(r"(19|20)\d{2}", text)
-        if years:
-            last = years[-1]
-            return None, int(last)
+        return None, int(years[-1])
     return None, None
 
 
+_PAREN_RX = re.compile(r"\(([^)]+)\)")
+# Text after the first " in " (any case), up to the first separator or a
+# lowercase " at ".
+_IN_FIELD_RX = re.compile(r" [Ii][Nn] (.*?)(?=[,|\-–]| at |$)")
+_DIGIT_RUN_RX = re.compile(r"\d{2,4}")
+_INST_RX = _compile_linear(r"([A-Z][A-Za-z&. ]+(?:University|College|Institute|School|Academy))")
+
+
 def extract_field_and_institution(block_text: str) -> Tuple[Optional[str], Optional[str]]:
     """
     Try to extract field of study and institution from a degree block text.
@@ -236,42 +350,36 @@ def extract_field_and_institution(block_text: str) -> Tuple[Optional[str], Optio
     institution = None
 
     # Field from parentheses
-    paren = re.search(r"\(([^)]+)\)", block_text)
+    paren = _PAREN_RX.search(block_text)
     if paren:
         raw = paren.group(1).strip()
-        if len(raw) > 2 and not re.search(r"\d{2,4}", raw):
+        if len(raw) > 2 and not _DIGIT_RUN_RX.search(raw):
             field = raw
 
     # Field from "in X"
     if field is None:
-        low = block_text.lower()
-        if " in " in low:
-            idx = low.find(" in ")
-            after_orig = block_text[idx + 4:]
-            for sep in [",", "|", "-", "–", " at "]:
-                if sep in after_orig:
-                    after_orig = after_orig.split(sep)[0]
-            f = after_orig.strip(" ,.-–")
-            if len(f) > 2 and not re.search(r"\d{2,4}", f):
+        in_match = _IN_FIELD_RX.search(block_text)
+        if in_match:
+            f = in_match.group(1).strip(" ,.-–")
+            if len(f) > 2 and not _DIGIT_RUN_RX.search(f):
                 field = f
 
     # Institution: look for University / College / Institute / School
-    inst_match = re.search(
-        r"([A-Z][A-Za-z&. ]+(University|College|Institute|School|Academy))",
-        block_text,
-    )
+    inst_match = _INST_RX.search(block_text)
     if inst_match:
         institution = inst_match.group(1).strip()
 
     return field, institution
 
 
-def extract_degrees_detail(education_text: str, full_text: str) -> List[Dict[str, Any]]:
+def extract_degrees_detail(
+    education_text: str, full_text: str, full_text_low: Optional[str] = None
+) -> List[Dict[str, Any]]:
     """
     Extract detailed degree info:
     degree_type, field_of_study, institution, start_year, end_year, status.
     """
-    lines = [ln.strip() for ln in education_text.splitlines() if ln.strip()]
+    lines = [ln for ln in (raw.strip() for raw in education_text.splitlines()) if ln]
     if not lines:
         return []
 
@@ -280,8 +388,7 @@ def extract_degrees_detail(education_text: str, full_text: str) -> List[Dict[str
 
     # Heuristic: start a new block when a line has a degree keyword
     for line in lines:
-        ll = line.lower()
-        has_degree_kw = any(re.search(pat, ll) for pat in DEGREE_PATTERNS.keys())
+        has_degree_kw = _DEGREE_RX.search(line) is not None
         if has_degree_kw:
             if current:
                 blocks.append(current)
@@ -292,7 +399,7 @@ def extract_degrees_detail(education_text: str, full_text: str) -> List[Dict[str
     if current:
         blocks.append(current)
 
-    phd_status_global = get_phd_status(full_text)
+    phd_status_global = get_phd_status(full_text, full_text_low)
 
     detailed: List[Dict[str, Any]] = []
 
@@ -357,21 +464,27 @@ def extract_degrees_detail(education_text: str, full_text: str) -> List[Dict[str
 
 # ---------- Department from fields ----------
 
+def _first_department(text_low: str) -> Optional[str]:
+    """
+    Return the department of the earliest DEPARTMENT_KEYWORDS entry found in
+    the lowercase text, using one automaton pass.
+    """
+    best = min((value for _, value in _DEPT_AC.iter(text_low)), default=None)
+    return best[1] if best else None
+
+
 def infer_department_from_fields(fields_of_study: List[str]) -> str:
     for field in fields_of_study:
-        f_low = field.lower()
-        for keyword, department in DEPARTMENT_KEYWORDS.items():
-            if keyword in f_low:
-                return department
+        department = _first_department(field.lower())
+        if department:
+            return department
     return "Unknown"
 
 
-def infer_department_from_text(text: str) -> str:
-    text_low = text.lower()
-    for keyword, department in DEPARTMENT_KEYWORDS.items():
-        if keyword in text_low:
-            return department
-    return "Unknown"
+def infer_department_from_text(text: str, text_low: Optional[str] = None) -> str:
+    if text_low is None:
+        text_low = text.lower()
+    return _first_department(text_low) or "Unknown"
 
 # ---------- Scoring ----------
 
@@ -402,24 +515,34 @@ def score_resume(
 
 # ---------- Personal info ----------
 
+_EMAIL_RX = _compile_linear(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+_PHONE_RX = re.compile(r"(\+?\d[\d\s\-]{8,}\d)")
+_NON_DIGIT_RX = re.compile(r"\D")
+_DIGIT_RX = re.compile(r"\d")
+_INDIA_LOCATION_RX = re.compile(r"([A-Za-z ]+,\s*India\b)", re.IGNORECASE)
+
+
 def extract_email(text: str) -> Optional[str]:
-    m = re.search(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", text)
+    m = _EMAIL_RX.search(text)
     return m.group(0) if m else None
 
 
-def extract_phone(text: str) -> Optional[str]:
-    lines = text.splitlines()
+def extract_phone(text: str, lines: Optional[List[str]] = None) -> Optional[str]:
+    if lines is None:
+        lines = text.splitlines()
     top = "\n".join(lines[:15])
-    candidates = re.findall(r"(\+?\d[\d\s\-]{8,}\d)", top)
+    candidates = _PHONE_RX.findall(top)
     for cand in candidates:
-        digits = re.sub(r"\D", "", cand)
+        digits = _NON_DIGIT_RX.sub("", cand)
         if 10 <= len(digits) <= 13:
             return cand.strip()
     return None
 
 
-def extract_name(text: str) -> Optional[str]:
-    for line in text.splitlines():
+def extract_name(text: str, lines: Optional[List[str]] = None) -> Optional[str]:
+    if lines is None:
+        lines = text.splitlines()
+    for line in lines:
         name = line.strip()
         if not name:
             continue
@@ -429,117 +552,155 @@ def extract_name(text: str) -> Optional[str]:
             if low.startswith(p):
                 name = name[len(p):].strip()
                 break
-        if "@" not in name and not re.search(r"\d", name):
+        if "@" not in name and not _DIGIT_RX.search(name):
             return name
         else:
             return name
     return None
 
 
-def extract_location(text: str) -> Optional[str]:
-    lines = text.splitlines()
-    for line in lines[:15]:
-        if "india" in line.lower():
+def extract_location(
+    text: str,
+    lines: Optional[List[str]] = None,
+    lines_low: Optional[List[str]] = None,
+) -> Optional[str]:
+    if lines is None:
+        lines = text.splitlines()
+    if lines_low is None:
+        lines_low = [line.lower() for line in lines[:15]]
+    for line, ll in zip(lines[:15], lines_low[:15]):
+        if "india" in ll:
             if "|" in line:
                 part = line.split("|")[-1].strip()
                 return part
-            m = re.search(r"([A-Za-z ]+,\s*India\b)", line, re.IGNORECASE)
+            m = _INDIA_LOCATION_RX.search(line)
             if m:
                 return m.group(1).strip()
     return None
 
 
-def extract_current_organization(text: str) -> Optional[str]:
-    lines = text.splitlines()
-    work_start = None
-    for i, line in enumerate(lines):
-        if "work experience" in line.lower():
-            work_start = i
-            break
-    start_idx = work_start if work_start is not None else 0
-
-    # Try "currently working" / "present"
-    for i in range(start_idx, len(lines)):
-        ll = lines[i].lower()
-        if "currently working" in ll or "present" in ll:
-            for j in range(i + 1, min(i + 5, len(lines))):
-                candidate = lines[j].strip()
+ORG_KEYWORDS: List[str] = [
+    "university", "college", "institute", "school", "company", "pvt", "ltd", "inc"
+]
+_ORG_RX = re.compile("|".join(map(re.escape, ORG_KEYWORDS)))
+
+
+def extract_current_organization(
+    text: str,
+    lines: Optional[List[str]] = None,
+    lines_low: Optional[List[str]] = None,
+) -> Optional[str]:
+    if lines is None:
+        lines = text.splitlines()
+    if lines_low is None:
+        lines_low = [line.lower() for line in lines]
+
+    # Single sweep. Both rules apply from the first WORK EXPERIENCE line (or
+    # the top if there is none), so their hits are reset when it is found.
+    work_seen = False
+    start_idx = 0
+    current: Optional[str] = None  # after a "currently working" / "present" line
+    org: Optional[str] = None      # first organization-like line
+    for i, ll in enumerate(lines_low):
+        if not work_seen and "work experience" in ll:
+            work_seen = True
+            start_idx = i
+            current = org = None
+
+        if current is None and ("currently working" in ll or "present" in ll):
+            for candidate in lines[i + 1:i + 5]:
+                candidate = candidate.strip()
                 if candidate:
-                    return candidate
-
-    # Fallback: first organization-like line after WORK EXPERIENCE
-    org_keywords = ["university", "college", "institute", "school", "company", "pvt", "ltd", "inc"]
-    for i in range(start_idx, min(start_idx + 20, len(lines))):
-        ll = lines[i].lower()
-        if any(k in ll for k in org_keywords):
-            cand = lines[i].strip()
-            if cand:
-                return cand
-    return None
+                    current = candidate
+                    break
+            if current is not None and work_seen:
+                return current
+
+        if org is None and i < start_idx + 20 and _ORG_RX.search(ll):
+            org = lines[i].strip() or None
+
+    # Fallback: first organization-like line within 20 lines of the start
+    return current or org
 
 # ---------- Experience breakdown ----------
 
-def calculate_experience_breakdown(text: str) -> Dict[str, Optional[float]]:
+MONTH_MAP: Dict[str, int] = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+TEACHING_KEYWORDS: List[str] = [
+    "professor", "assistant professor", "associate professor",
+    "lecturer", "teacher", "faculty", "school", "college", "university",
+    "institute", "academy"
+]
+INDUSTRY_KEYWORDS: List[str] = [
+    "developer", "software", "engineer", "company", "pvt", "ltd",
+    "solutions", "consultant", "analyst", "manager", "industry",
+    "it services", "technologies", "firm", "corporation"
+]
+
+_MONTH_PATTERN = (
+    r"(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|"
+    r"Jul(?:y)?|Aug(?:ust)?|Sep(?:t(?:ember)?)?|Oct(?:ober)?|"
+    r"Nov(?:ember)?|Dec(?:ember)?)"
+)
+_EXP_RX = re.compile(
+    rf"(?P<from_month>{_MONTH_PATTERN})\s+(?P<from_year>\d{{4}})\s*[-–]\s*"
+    rf"(?:(?P<to_month>{_MONTH_PATTERN})\s+(?P<to_year>\d{{4}})|"
+    r"(?P<to_label>Present|Currently Working|Current|Till Date|Now))",
+    re.IGNORECASE,
+)
+
+# Context windows are lowercase, so plain alternations of the keywords do.
+_TEACH_RX = re.compile("|".join(map(re.escape, TEACHING_KEYWORDS)))
+_IND_RX = re.compile("|".join(map(re.escape, INDUSTRY_KEYWORDS)))
+
+
+def calculate_experience_breakdown(
+    text: str, text_low: Optional[str] = None
+) -> Dict[str, Optional[float]]:
     """
     Parse date ranges and approximate teaching vs industry vs total experience in years.
     """
-    month_pattern = (
-        r"(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|"
-        r"Jul(?:y)?|Aug(?:ust)?|Sep(?:t(?:ember)?)?|Oct(?:ober)?|"
-        r"Nov(?:ember)?|Dec(?:ember)?)"
-    )
-    range_pattern = (
-        rf"(?P<from_month>{month_pattern})\s+(?P<from_year>\d{{4}})\s*[-–]\s*"
-        rf"(?:(?P<to_month>{month_pattern})\s+(?P<to_year>\d{{4}})|"
-        r"(?P<to_label>Present|Currently Working|Current|Till Date|Now))"
-    )
-
-    month_map = {
-        "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
-        "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
-    }
+    if text_low is None:
+        text_low = text.lower()
 
-    teaching_keywords = [
-        "professor", "assistant professor", "associate professor",
-        "lecturer", "teacher", "faculty", "school", "college", "university",
-        "institute", "academy"
-    ]
-    industry_keywords = [
-        "developer", "software", "engineer", "company", "pvt", "ltd",
-        "solutions", "consultant", "analyst", "manager", "industry",
-        "it services", "technologies", "firm", "corporation"
-    ]
+    today = date.today()
+    today_index = today.year * 12 + today.month
 
     teaching_months = 0
     industry_months = 0
     other_months = 0
 
-    today = date.today()
-
-    for m in re.finditer(range_pattern, text, re.IGNORECASE):
-        fm_str = m.group("from_month")[:3].lower()
-        from_month = month_map.get(fm_str)
-        from_year = int(m.group("from_year"))
+    # Match on the lowered text so context windows can be sliced from it
+    # directly (lower() may shift offsets relative to the original).
+    for m in _EXP_RX.finditer(text_low):
+        fm_str, fy_str, tm_str, ty_str = m.group(
+            "from_month", "from_year", "to_month", "to_year"
+        )
+        from_month = MONTH_MAP.get(fm_str[:3])
         if from_month is None:
             continue
+        from_index = int(fy_str) * 12 + from_month
 
-        if m.group("to_month"):
-            tm_str = m.group("to_month")[:3].lower()
-            to_month = month_map.get(tm_str, today.month)
-            to_year = int(m.group("to_year"))
+        if tm_str:
+            to_month = MONTH_MAP.get(tm_str[:3], today.month)
+            to_index = int(ty_str) * 12 + to_month
         else:
-            to_year = today.year
-            to_month = today.month
+            to_index = today_index
 
-        months = (to_year - from_year) * 12 + (to_month - from_month)
+        months = to_index - from_index
         if months <= 0:
             continue
 
-        # Classify this period by context around the match
-        ctx = text[max(0, m.start() - 120): m.end() + 120].lower()
-        if any(kw in ctx for kw in teaching_keywords):
+        # Classify this period by context around the match; pos/endpos
+        # bound the search to the window without slicing it out.
+        ctx_start = max(0, m.start() - 120)
+        ctx_end = m.end() + 120
+        if _TEACH_RX.search(text_low, ctx_start, ctx_end):
             teaching_months += months
-        elif any(kw in ctx for kw in industry_keywords):
+        elif _IND_RX.search(text_low, ctx_start, ctx_end):
             industry_months += months
         else:
             other_months += months
@@ -560,17 +721,31 @@ def calculate_experience_breakdown(text: str) -> Dict[str, Optional[float]]:
 
 # ---------- Publications breakdown ----------
 
-def count_publications_breakdown(text: str) -> Dict[str, int]:
+_PUB_NUM_RX = re.compile(r"^\s*\d+\s")
+
+# One match per (lowercase) publication line. Each alternative is a set of
+# lookaheads tried at the line start, so the first category that applies
+# wins regardless of where its keywords appear in the line.
+_PUB_CATEGORY_RX = re.compile(
+    r"(?=.*(?:book|isbn|chapter))(?P<books>)"
+    r"|(?=.*(?:journal|volume|issue|issn|paper published))(?P<articles>)"
+    r"|(?=.*presented)(?=.*(?:conference|seminar))(?P<conferences>)"
+)
+
+
+def count_publications_breakdown(
+    text: str, lines_low: Optional[List[str]] = None
+) -> Dict[str, int]:
     """
     Parse the 'DETAILS OF RESEARCH PUBLICATIONS/BOOKS/ARTICLE/PRESENTATIONS' section,
     and approximate counts for total, articles, books, conference papers.
     """
-    lines = text.splitlines()
+    lines = lines_low if lines_low is not None else text.lower().splitlines()
     start = None
     end = len(lines)
 
     for i, line in enumerate(lines):
-        if "details of research publications" in line.lower():
+        if "details of research publications" in line:
             start = i
             break
     if start is None:
@@ -582,36 +757,26 @@ def count_publications_breakdown(text: str) -> Dict[str, int]:
         }
 
     for j in range(start + 1, len(lines)):
-        if "refresher courses" in lines[j].lower():
+        if "refresher courses" in lines[j]:
             end = j
             break
 
-    total = 0
-    articles = 0
-    books = 0
-    conferences = 0
+    counts = {
+        "total": 0,
+        "articles": 0,
+        "books": 0,
+        "conferences": 0,
+    }
 
-    for line in lines[start:end]:
-        if not re.match(r"^\s*\d+\s", line):
+    for low in lines[start:end]:
+        if not _PUB_NUM_RX.match(low):
             continue
-        total += 1
-        low = line.lower()
-        if "book" in low or "isbn" in low or "chapter" in low:
-            books += 1
-        elif any(k in low for k in ["journal", "volume", "issue", "issn", "paper published"]):
-            articles += 1
-        elif "presented" in low and any(k in low for k in ["conference", "seminar"]):
-            conferences += 1
-        else:
-            # if nothing matched, treat as article by default
-            articles += 1
+        counts["total"] += 1
+        m = _PUB_CATEGORY_RX.match(low)
+        # if nothing matched, treat as article by default
+        counts[m.lastgroup if m else "articles"] += 1
 
-    return {
-        "total": total,
-        "articles": articles,
-        "books": books,
-        "conferences": conferences,
-    }
+    return counts
 
 # ---------- MAIN PUBLIC FUNCTION ----------
 
@@ -621,14 +786,19 @@ def analyze_resume_text(
     """
     Analyze resume text and return structured result.
     """
-    education_text = extract_education_section(text)
+    # Lowercase and split once; helpers reuse these instead of redoing it.
+    text_low = text.lower()
+    lines = text.splitlines()
+    lines_low = text_low.splitlines()
+
+    edu_start, edu_end = find_education_section(text, text_low)
 
     # Degree details
-    degrees_info = extract_degrees_detail(education_text, text)
-    degree_types = [d["degree_type"] for d in degrees_info]
-    degrees_detected = sorted(set(degree_types), key=lambda d: DEGREE_PRIORITY.get(d, 0), reverse=True)
+    degrees_info = extract_degrees_detail(text[edu_start:edu_end], text, text_low)
+    degree_types = {d["degree_type"] for d in degrees_info}
+    degrees_detected = sorted(degree_types, key=_degree_priority, reverse=True)
     highest_deg = determine_highest_degree(degrees_detected)
-    has_phd_flag = "PhD" in degrees_detected
+    has_phd_flag = "PhD" in degree_types
 
     # PhD years from degrees_info
     phd_start_year = None
@@ -650,23 +820,23 @@ def analyze_resume_text(
 
     department = infer_department_from_fields(fields_of_study)
     if department == "Unknown":
-        department = infer_department_from_text(text)
+        department = infer_department_from_text(text, text_low)
 
     # Score
     score = score_resume(has_phd_flag, highest_deg, department, target_department)
 
     # Personal details
-    name = extract_name(text)
+    name = extract_name(text, lines)
     email = extract_email(text)
-    phone = extract_phone(text)
-    location = extract_location(text)
-    current_org = extract_current_organization(text)
+    phone = extract_phone(text, lines)
+    location = extract_location(text, lines, lines_low)
+    current_org = extract_current_organization(text, lines, lines_low)
 
     # Experience
-    exp_breakdown = calculate_experience_breakdown(text)
+    exp_breakdown = calculate_experience_breakdown(text, text_low)
 
     # Publications
-    pubs = count_publications_breakdown(text)
+    pubs = count_publications_breakdown(text, lines_low)
 
     result: Dict[str, Any] = {
         "name": name,